@@ -1,12 +1,46 @@
-from pydantic_settings import BaseSettings
-from typing import List
+from dataclasses import dataclass, field, fields
+from dotenv import dotenv_values
+from typing import FrozenSet, List
+import atexit
+import json
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 
 
-class Settings(BaseSettings):
+# --- Environment parsing ---
+
+def _parse_bool(raw: str) -> bool:
+    value = raw.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"invalid boolean: {raw!r}")
+
+
+def _parse_list(raw: str) -> List[str]:
+    """Accept a JSON array (as pydantic-settings did) or a comma-separated list."""
+    raw = raw.strip()
+    if raw.startswith("["):
+        return [str(item) for item in json.loads(raw)]
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+_PARSERS = {
+    str: str,
+    int: int,
+    bool: _parse_bool,
+    List[str]: _parse_list,
+    FrozenSet[str]: lambda raw: frozenset(_parse_list(raw)),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings and configuration"""
 
     # API
@@ -18,7 +52,7 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     reload: bool = False
-    workers: int = 1
+    workers: int = 1  # 0 = one per available CPU
 
     # Gemini API
     gemini_api_key: str = ""
@@ -26,25 +60,30 @@ class Settings(BaseSettings):
 
     # File Upload
     max_file_size: int = 20 * 1024 * 1024  # 20MB
-    allowed_file_types: List[str] = [
+    max_request_overhead: int = 64 * 1024  # multipart framing and form fields
+    allowed_file_types: FrozenSet[str] = frozenset({
         "image/jpeg",
         "image/png",
         "image/gif",
         "image/webp",
-    ]
+    })
 
     # CORS
     cors_enabled: bool = True
-    cors_origins: List[str] = [
+    cors_origins: FrozenSet[str] = frozenset({
         "http://localhost:8000",
         "http://localhost:3000",
         "http://127.0.0.1:54422",
         "http://127.0.0.1:8000",
         "*",
-    ]
+    })
     cors_credentials: bool = False
-    cors_methods: List[str] = ["*"]
-    cors_headers: List[str] = ["*"]
+    cors_methods: List[str] = field(default_factory=lambda: ["*"])
+    cors_headers: List[str] = field(default_factory=lambda: ["*"])
+
+    # Compression
+    gzip_enabled: bool = True
+    gzip_minimum_size: int = 1024
 
     # Logging
     log_level: str = "INFO"
@@ -52,10 +91,26 @@ class Settings(BaseSettings):
     log_file: str = "ocr_api.log"
     enable_file_logging: bool = False
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "allow"
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """Build settings from ``env_file`` overlaid with the process environment.
+
+        Variable names are matched case-insensitively against field names.
+        """
+        env = {k.lower(): v for k, v in dotenv_values(env_file).items() if v is not None}
+        env.update((k.lower(), v) for k, v in os.environ.items())
+
+        values = {}
+        for f in fields(cls):
+            parser = _PARSERS.get(f.type)
+            if parser is None:
+                raise TypeError(f"Settings.{f.name}: unsupported field type {f.type!r}")
+            if f.name in env:
+                try:
+                    values[f.name] = parser(env[f.name])
+                except ValueError as e:
+                    raise ValueError(f"{f.name.upper()}: {e}") from e
+        return cls(**values)
 
     # --- Validation helpers ---
 
@@ -74,9 +129,6 @@ class Settings(BaseSettings):
             return False
         return True
 
-    def is_file_type_allowed(self, content_type: str) -> bool:
-        return content_type in self.allowed_file_types
-
     @property
     def max_file_size_mb(self) -> float:
         return self.max_file_size / (1024 * 1024)
@@ -89,12 +141,12 @@ class Settings(BaseSettings):
         logger.info(f"Server: {self.host}:{self.port}")
         logger.info(f"Gemini Model: {self.gemini_model}")
         logger.info(f"Max File Size: {self.max_file_size_mb:.0f}MB")
-        logger.info(f"Allowed Types: {', '.join(self.allowed_file_types)}")
+        logger.info(f"Allowed Types: {', '.join(sorted(self.allowed_file_types))}")
         logger.info(f"CORS: {'Enabled' if self.cors_enabled else 'Disabled'}")
         logger.info("=" * 60)
 
 
-settings = Settings()
+settings = Settings.from_env()
 
 
 # --- Logger setup ---
@@ -105,11 +157,12 @@ def _setup_logger(name: str) -> logging.Logger:
     _logger.handlers.clear()
 
     formatter = logging.Formatter(settings.log_format)
+    handlers = []
 
     console = logging.StreamHandler(sys.stdout)
     console.setLevel(getattr(logging, settings.log_level))
     console.setFormatter(formatter)
-    _logger.addHandler(console)
+    handlers.append(console)
 
     if settings.enable_file_logging:
         log_path = Path(settings.log_file)
@@ -119,7 +172,23 @@ def _setup_logger(name: str) -> logging.Logger:
         )
         file_handler.setLevel(getattr(logging, settings.log_level))
         file_handler.setFormatter(formatter)
-        _logger.addHandler(file_handler)
+        # Batch file writes; warnings and errors flush immediately so they are never held back.
+        buffered = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffered.setLevel(getattr(logging, settings.log_level))
+        atexit.register(buffered.flush)
+        handlers.append(buffered)
+
+    # Request paths only enqueue; the listener thread does the actual I/O.
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    _logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return _logger
 
@@ -0,0 +1,74 @@
+from typing import Iterable
+
+from fastapi import HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import logger
+
+
+class BodySizeLimitMiddleware:
+    """Reject request bodies larger than ``max_body_size`` before they are parsed.
+
+    A declared ``Content-Length`` over the limit is refused with 413 without
+    reading any of the body. Bodies without one (chunked) are counted as they
+    stream in and aborted with 413 as soon as they cross the limit.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_body_size:
+                logger.warning(
+                    f"Request too large: {content_length} bytes (max: {self.max_body_size})"
+                )
+                response = JSONResponse({"detail": self._detail()}, status_code=413)
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    logger.warning(f"Request body exceeded {self.max_body_size} bytes")
+                    # Raised inside the app, so FastAPI turns it into a 413 response.
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        return f"Request too large. Maximum size is {self.max_body_size / (1024 * 1024):.2f}MB"
+
+
+class TextGZipMiddleware:
+    """Apply gzip only to the given text-returning paths.
+
+    Audio responses are already-compressed MP3; running them through zlib on
+    the event loop costs CPU for almost no size gain.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str], minimum_size: int) -> None:
+        self.app = app
+        self.paths = frozenset(paths)
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -1,20 +1,28 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from PIL import Image
-from gtts import gTTS
+import asyncio
 import io
 
 from app.config import settings, logger
-from app.utils import _validate_upload, _extract_text, _text_response, _text_to_audio_response
+from app.utils import (
+    _validate_upload,
+    _extract_text,
+    _text_response,
+    _render_tts,
+    _text_to_audio_response,
+)
 
 router = APIRouter()
 
+# Endpoints returning compressible text; audio endpoints are excluded from gzip.
+TEXT_PATHS = ("/ocr", "/ocr-with-prompt")
+
 DEFAULT_PROMPT = "Extract all text from this image. Preserve the layout and structure as much as possible."
 
 
 @router.get("/")
 async def root():
     """Root / health check endpoint."""
-    logger.info("Health check request received")
+    logger.debug("Health check request received")
     return {
         "message": "OCR API is running",
         "name": settings.app_name,
@@ -34,14 +42,13 @@ async def extract_text(file: UploadFile = File(...)):
 
     Supported formats: JPEG, PNG, GIF, WebP
     """
-    logger.info(f"OCR request: {file.filename}")
+    logger.debug("OCR request: %s", file.filename)
     try:
+        _validate_upload(file)
         contents = await file.read()
-        _validate_upload(file, contents)
-        Image.open(io.BytesIO(contents))  # validate image
 
-        text = _extract_text(contents, file.content_type, DEFAULT_PROMPT)
-        logger.info(f"Text extraction successful: {file.filename}")
+        text = await _extract_text(contents, file.content_type, DEFAULT_PROMPT)
+        logger.debug("Text extraction successful: %s", file.filename)
         return _text_response(text, file.filename)
     except HTTPException:
         raise
@@ -56,14 +63,13 @@ async def extract_text_with_prompt(
     prompt: str = "Extract all text from this image",
 ):
     """Extract text from an image with a custom prompt."""
-    logger.info(f"OCR-with-prompt request: {file.filename}")
+    logger.debug("OCR-with-prompt request: %s", file.filename)
     try:
+        _validate_upload(file)
         contents = await file.read()
-        _validate_upload(file, contents)
-        Image.open(io.BytesIO(contents))
 
-        text = _extract_text(contents, file.content_type, prompt)
-        logger.info(f"Text extraction successful (custom prompt): {file.filename}")
+        text = await _extract_text(contents, file.content_type, prompt)
+        logger.debug("Text extraction successful (custom prompt): %s", file.filename)
         return _text_response(text, file.filename)
     except HTTPException:
         raise
@@ -79,20 +85,19 @@ async def extract_text_as_audio(file: UploadFile = File(...), lang: str = "en"):
     - **file**: Image file (JPEG, PNG, GIF, WebP)
     - **lang**: Language code for speech (default: en)
     """
-    logger.info(f"OCR-Audio request: {file.filename}")
+    logger.debug("OCR-Audio request: %s", file.filename)
     try:
+        _validate_upload(file)
         contents = await file.read()
-        _validate_upload(file, contents)
-        Image.open(io.BytesIO(contents))
 
-        text = _extract_text(contents, file.content_type, DEFAULT_PROMPT)
-        logger.info(f"Text extraction successful: {file.filename}")
+        text = await _extract_text(contents, file.content_type, DEFAULT_PROMPT)
+        logger.debug("Text extraction successful: %s", file.filename)
 
         if not text.strip():
             raise HTTPException(status_code=422, detail="No text found in the image.")
 
-        logger.info(f"Converting text to audio (lang={lang})")
-        return _text_to_audio_response(text, file.filename, lang)
+        logger.debug("Converting text to audio (lang=%s)", lang)
+        return await _text_to_audio_response(text, file.filename, lang)
     except HTTPException:
         raise
     except Exception as e:
@@ -107,21 +112,19 @@ async def text_to_audio(text: str = Form(...), lang: str = Form("en")):
     - **text**: The text to convert to speech
     - **lang**: Language code (default: en)
     """
-    logger.info(f"Text-to-Audio request ({len(text)} chars, lang={lang})")
+    logger.debug("Text-to-Audio request (%d chars, lang=%s)", len(text), lang)
     try:
         if not text.strip():
             raise HTTPException(status_code=400, detail="Text cannot be empty.")
 
-        tts = gTTS(text=text, lang=lang)
         buf = io.BytesIO()
-        tts.write_to_fp(buf)
-        buf.seek(0)
+        await asyncio.to_thread(_render_tts, text, lang, buf)
 
-        logger.info("Text-to-Audio conversion successful")
+        logger.debug("Text-to-Audio conversion successful")
         from fastapi.responses import Response
 
         return Response(
-            content=buf.read(),
+            content=buf.getvalue(),
             media_type="audio/mpeg",
             headers={"Content-Disposition": 'attachment; filename="text_audio.mp3"'},
         )
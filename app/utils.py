@@ -1,56 +1,125 @@
 from fastapi import UploadFile, File, Form, HTTPException
-from fastapi.responses import Response
-from PIL import Image
-from gtts import gTTS
-import google.generativeai as genai
+from fastapi.responses import PlainTextResponse, Response
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+import asyncio
 import io
 import os
 
 from app.config import settings, logger
 
+# google.generativeai and gtts are heavy; import them on first use.
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
-def _validate_upload(file: UploadFile, contents: bytes) -> None:
-    """Validate file type and size; raises HTTPException on failure."""
-    if not settings.is_file_type_allowed(file.content_type):
-        allowed = ", ".join(settings.allowed_file_types)
+# Hot-path settings, resolved once at import.
+_ALLOWED_TYPES = settings.allowed_file_types
+_MAX_SIZE = settings.max_file_size
+_MAX_MB = settings.max_file_size_mb
+
+# Quotes, backslashes, slashes and control characters (incl. CR/LF) would
+# break out of a quoted Content-Disposition filename.
+_BAD_FILENAME_CHARS = str.maketrans(
+    {c: "_" for c in '"\\/' + "".join(map(chr, range(0x20))) + "\x7f"}
+)
+
+
+def _content_disposition(filename: str, suffix: str) -> str:
+    """Build an attachment header for ``filename`` with its extension replaced by ``suffix``.
+
+    Emits an ASCII ``filename`` fallback plus an RFC 5987 ``filename*`` so
+    non-latin-1 names survive header encoding.
+    """
+    name = os.path.splitext(filename)[0].translate(_BAD_FILENAME_CHARS) + suffix
+    fallback = name.encode("ascii", "replace").decode("ascii")
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(name, safe='')}"
+
+
+def _file_too_large(size: int) -> HTTPException:
+    logger.warning(f"File too large: {size} bytes (max: {_MAX_SIZE})")
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size is {_MAX_MB:.2f}MB",
+    )
+
+
+def _sniff_image(contents: bytes, mime: str) -> bool:
+    """Check that the leading magic bytes match the declared image MIME type."""
+    if mime == "image/png":
+        return contents.startswith(b"\x89PNG\r\n\x1a\n")
+    if mime == "image/jpeg":
+        return contents.startswith(b"\xff\xd8\xff")
+    if mime == "image/gif":
+        return contents.startswith((b"GIF87a", b"GIF89a"))
+    if mime == "image/webp":
+        return contents[:4] == b"RIFF" and contents[8:12] == b"WEBP"
+    return False
+
+
+def _validate_upload(file: UploadFile) -> None:
+    """Validate file type, size and image header; raises HTTPException on failure.
+
+    Starlette has already spooled the body, so the size is known and the
+    header is peeked from the underlying file without reading it all.
+    """
+    if file.content_type not in _ALLOWED_TYPES:
+        allowed = ", ".join(sorted(_ALLOWED_TYPES))
         logger.warning(f"Invalid file type: {file.content_type}")
         raise HTTPException(status_code=400, detail=f"Invalid file type. Allowed: {allowed}")
 
-    if len(contents) > settings.max_file_size:
-        logger.warning(f"File too large: {len(contents)} bytes (max: {settings.max_file_size})")
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {settings.max_file_size_mb:.2f}MB",
-        )
+    if file.size is not None and file.size > _MAX_SIZE:
+        raise _file_too_large(file.size)
+
+    head = file.file.read(12)
+    file.file.seek(0)
+    if not _sniff_image(head, file.content_type):
+        logger.warning(f"Image header does not match {file.content_type}: {file.filename}")
+        raise HTTPException(status_code=400, detail="Invalid image file.")
 
 
-def _extract_text(contents: bytes, mime_type: str, prompt: str) -> str:
+@lru_cache(maxsize=1)
+def _get_model() -> "genai.GenerativeModel":
+    """Return the shared Gemini model, built once per process."""
+    import google.generativeai as genai
+
+    return genai.GenerativeModel(settings.gemini_model)
+
+
+async def _extract_text(contents: bytes, mime_type: str, prompt: str) -> str:
     """Call Gemini Vision API and return extracted text."""
-    image_data = {"mime_type": mime_type, "data": contents}
-    model = genai.GenerativeModel(settings.gemini_model)
-    response = model.generate_content([prompt, image_data])
+    import google.generativeai as genai
+
+    # Build the proto part directly so the SDK does not re-coerce a dict.
+    image_part = genai.protos.Part(
+        inline_data=genai.protos.Blob(mime_type=mime_type, data=contents)
+    )
+    response = await _get_model().generate_content_async([prompt, image_part])
     return response.text
 
 
-def _text_response(text: str, filename: str) -> Response:
+def _text_response(text: str, filename: str) -> PlainTextResponse:
     """Return extracted text as a downloadable .txt file."""
-    base = os.path.splitext(filename)[0]
-    return Response(
-        content=text,
-        media_type="text/plain; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{base}_extracted.txt"'},
+    return PlainTextResponse(
+        text,
+        headers={"Content-Disposition": _content_disposition(filename, "_extracted.txt")},
     )
 
 
-def _text_to_audio_response(text: str, filename: str, lang: str) -> Response:
-    """Convert text to MP3 and return as downloadable response."""
+def _render_tts(text: str, lang: str, buf: io.BytesIO) -> None:
+    """Synthesize speech into ``buf``. Blocking: gTTS calls Google over HTTP."""
+    from gtts import gTTS
+
     tts = gTTS(text=text, lang=lang)
-    buf = io.BytesIO()
     tts.write_to_fp(buf)
-    buf.seek(0)
-    base = os.path.splitext(filename)[0]
+
+
+async def _text_to_audio_response(text: str, filename: str, lang: str) -> Response:
+    """Convert text to MP3 and return as downloadable response."""
+    buf = io.BytesIO()
+    await asyncio.to_thread(_render_tts, text, lang, buf)
     return Response(
-        content=buf.read(),
+        content=buf.getvalue(),
         media_type="audio/mpeg",
-        headers={"Content-Disposition": f'attachment; filename="{base}_audio.mp3"'},
+        headers={"Content-Disposition": _content_disposition(filename, "_audio.mp3")},
     )
@@ -1,11 +1,13 @@
 from contextlib import asynccontextmanager
+import os
 
-import google.generativeai as genai
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings, logger
-from app.routes import router
+from app.middleware import BodySizeLimitMiddleware, TextGZipMiddleware
+from app.routes import TEXT_PATHS, router
+from app.utils import _get_model
 
 
 @asynccontextmanager
@@ -15,7 +17,10 @@ async def lifespan(application: FastAPI):
     if not settings.validate():
         logger.error("Configuration validation failed — API calls will fail.")
     else:
+        import google.generativeai as genai
+
         genai.configure(api_key=settings.gemini_api_key)
+        _get_model()
         logger.info(f"Gemini API configured with model: {settings.gemini_model}")
     settings.log_summary()
     yield
@@ -28,6 +33,12 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Refuse oversize bodies before multipart parsing spools them
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_size=settings.max_file_size + settings.max_request_overhead,
+)
+
 # CORS
 if settings.cors_enabled:
     app.add_middleware(
@@ -38,10 +49,27 @@ if settings.cors_enabled:
         allow_headers=settings.cors_headers,
     )
 
+# Compression
+if settings.gzip_enabled:
+    app.add_middleware(
+        TextGZipMiddleware,
+        paths=TEXT_PATHS,
+        minimum_size=settings.gzip_minimum_size,
+    )
+
 # Register routes
 app.include_router(router)
 
 
+def _worker_count() -> int:
+    """Configured worker count; 0 means one per CPU this process may run on."""
+    if settings.workers:
+        return settings.workers
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -50,6 +78,6 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
-        workers=settings.workers,
+        workers=_worker_count(),
         log_level=settings.log_level.lower(),
     )
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+import pytest
+
+from app.config import Settings, _parse_bool, _parse_list
+
+
+@pytest.mark.parametrize("raw", ["1", "true", "True", "YES", "on", " true "])
+def test_parse_bool_true(raw):
+    assert _parse_bool(raw) is True
+
+
+@pytest.mark.parametrize("raw", ["0", "false", "FALSE", "no", "off", ""])
+def test_parse_bool_false(raw):
+    assert _parse_bool(raw) is False
+
+
+def test_parse_bool_rejects_garbage():
+    with pytest.raises(ValueError, match="invalid boolean"):
+        _parse_bool("maybe")
+
+
+def test_parse_list_json():
+    assert _parse_list('["a", "b c"]') == ["a", "b c"]
+
+
+def test_parse_list_csv():
+    assert _parse_list(" a, b ,,c ") == ["a", "b", "c"]
+
+
+def test_parse_list_empty():
+    assert _parse_list("") == []
+
+
+def test_from_env_defaults_without_env_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("PORT", raising=False)
+    settings = Settings.from_env(str(tmp_path / "missing.env"))
+    assert settings.port == 8000
+
+
+def test_from_env_reads_env_file_case_insensitively(tmp_path, monkeypatch):
+    for name in ("PORT", "DEBUG", "ALLOWED_FILE_TYPES"):
+        monkeypatch.delenv(name, raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text('port=9000\nDebug=yes\nALLOWED_FILE_TYPES=["image/png"]\n')
+
+    settings = Settings.from_env(str(env_file))
+
+    assert settings.port == 9000
+    assert settings.debug is True
+    assert settings.allowed_file_types == frozenset({"image/png"})
+
+
+def test_from_env_environment_overrides_env_file(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("PORT=9000\n")
+    monkeypatch.setenv("PORT", "9100")
+    monkeypatch.setenv("CORS_METHODS", "GET, POST")
+
+    settings = Settings.from_env(str(env_file))
+
+    assert settings.port == 9100
+    assert settings.cors_methods == ["GET", "POST"]
+
+
+def test_from_env_bad_int_names_the_variable(tmp_path, monkeypatch):
+    monkeypatch.setenv("PORT", "abc")
+    with pytest.raises(ValueError, match="^PORT: "):
+        Settings.from_env(str(tmp_path / "missing.env"))
+
+
+def test_from_env_rejects_unsupported_field_type(tmp_path):
+    @dataclass(frozen=True)
+    class ExtendedSettings(Settings):
+        labels: Dict[str, str] = field(default_factory=dict)
+
+    with pytest.raises(TypeError, match="Settings.labels: unsupported field type"):
+        ExtendedSettings.from_env(str(tmp_path / "missing.env"))
+
+
+def test_settings_are_frozen():
+    settings = Settings()
+    with pytest.raises(AttributeError):
+        settings.port = 1
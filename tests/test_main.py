@@ -0,0 +1,20 @@
+import dataclasses
+
+from fastapi.testclient import TestClient
+from google.ai.generativelanguage_v1beta.services.generative_service.transports import (
+    GenerativeServiceGrpcAsyncIOTransport,
+)
+from google.generativeai import client as genai_client
+
+import main
+
+
+def test_lifespan_configures_async_grpc_transport(monkeypatch):
+    # generate_content_async needs the grpc_asyncio transport; a pinned sync
+    # transport blocks the event loop and returns a non-awaitable response.
+    monkeypatch.setattr(main, "settings", dataclasses.replace(main.settings, gemini_api_key="test-key"))
+
+    with TestClient(main.app):
+        async_client = genai_client.get_default_generative_async_client()
+
+    assert isinstance(async_client.transport, GenerativeServiceGrpcAsyncIOTransport)
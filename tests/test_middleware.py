@@ -0,0 +1,92 @@
+import asyncio
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+import main
+from app.config import settings
+from app.middleware import BodySizeLimitMiddleware
+
+LIMIT = 1024
+BOUNDARY = "limit-test"
+
+
+def _limited_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(BodySizeLimitMiddleware, max_body_size=LIMIT)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": file.size}
+
+    return app
+
+
+def _multipart(payload: bytes) -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="a.png"\r\n'
+        "Content-Type: image/png\r\n\r\n"
+    ).encode() + payload + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def test_oversize_content_length_rejected_without_reading_body():
+    reads = []
+    sent = []
+
+    async def receive():
+        reads.append(True)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/upload",
+        "headers": [(b"content-length", str(LIMIT + 1).encode())],
+    }
+    asyncio.run(_limited_app()(scope, receive, send))
+
+    assert sent[0]["type"] == "http.response.start"
+    assert sent[0]["status"] == 413
+    assert reads == []
+
+
+def test_oversize_chunked_body_rejected_with_413():
+    body = _multipart(b"x" * (LIMIT * 4))
+
+    def chunks():
+        for i in range(0, len(body), 256):
+            yield body[i:i + 256]
+
+    client = TestClient(_limited_app())
+    response = client.post(
+        "/upload",
+        content=chunks(),
+        headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"},
+    )
+
+    assert response.request.headers.get("content-length") is None
+    assert response.status_code == 413
+    assert response.json()["detail"].startswith("Request too large")
+
+
+def test_body_under_limit_passes_through():
+    client = TestClient(_limited_app())
+    response = client.post("/upload", files={"file": ("a.png", b"x" * 100, "image/png")})
+
+    assert response.status_code == 200
+    assert response.json() == {"size": 100}
+
+
+def test_file_over_max_size_but_under_body_limit_rejected_by_handler():
+    payload = b"\x89PNG\r\n\x1a\n" + b"x" * settings.max_file_size
+    assert len(payload) + 1024 < settings.max_file_size + settings.max_request_overhead
+
+    client = TestClient(main.app)
+    response = client.post("/ocr", files={"file": ("a.png", payload, "image/png")})
+
+    assert response.status_code == 413
+    assert response.json()["detail"].startswith("File too large")
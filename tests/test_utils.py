@@ -0,0 +1,59 @@
+import pytest
+
+from app.utils import _content_disposition, _sniff_image
+
+
+@pytest.mark.parametrize(
+    "contents, mime",
+    [
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/png"),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00", "image/jpeg"),
+        (b"GIF87a\x01\x00\x01\x00", "image/gif"),
+        (b"GIF89a\x01\x00\x01\x00", "image/gif"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+    ],
+)
+def test_sniff_image_accepts_matching_signature(contents, mime):
+    assert _sniff_image(contents, mime)
+
+
+@pytest.mark.parametrize(
+    "contents, mime",
+    [
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/jpeg"),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00", "image/png"),
+        (b"RIFF\x24\x00\x00\x00WAVEfmt ", "image/webp"),
+        (b"GIF8", "image/gif"),
+        (b"", "image/png"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/bmp"),
+    ],
+)
+def test_sniff_image_rejects_mismatch(contents, mime):
+    assert not _sniff_image(contents, mime)
+
+
+def test_content_disposition_blocks_header_injection():
+    header = _content_disposition('x"\r\nSet-Cookie: a=b.png', "_extracted.txt")
+
+    assert header == (
+        'attachment; filename="x___Set-Cookie: a=b_extracted.txt"; '
+        "filename*=UTF-8''x___Set-Cookie%3A%20a%3Db_extracted.txt"
+    )
+    assert "\r" not in header and "\n" not in header
+    header.encode("latin-1")
+
+
+def test_content_disposition_replaces_control_chars_and_slashes():
+    header = _content_disposition("a\\b/c\x00d\x7f.png", "_audio.mp3")
+
+    assert 'filename="a_b_c_d__audio.mp3"' in header
+
+
+def test_content_disposition_non_latin1_name():
+    header = _content_disposition("写真 ü.png", "_extracted.txt")
+
+    assert header == (
+        'attachment; filename="?? ?_extracted.txt"; '
+        "filename*=UTF-8''%E5%86%99%E7%9C%9F%20%C3%BC_extracted.txt"
+    )
+    header.encode("latin-1")